@@ -22,13 +22,13 @@ source venv/bin/activate
 echo "Upgrading pip..."
 pip install --upgrade pip
 
-# Install dependencies
+# Install dependencies (including the test plugins used below)
 echo "Installing dependencies..."
-pip install -r requirements.txt
+pip install -r requirements-dev.txt
 
 # Test installation
 echo "Testing installation..."
-python test_setup.py
+python -m pytest -q tests/test_setup.py
 
 echo ""
 echo "Installation completed!"
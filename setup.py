@@ -48,8 +48,11 @@ setup(
     install_requires=requirements,
     extras_require={
         "dev": [
-            "pytest>=6.0",
+            "pytest>=7.0",
             "pytest-cov>=2.0",
+            "pytest-xdist[psutil]>=3.0",
+            "pytest-benchmark>=4.0",
+            "pytest-codspeed>=3.0",
             "black>=21.0",
             "flake8>=3.8",
             "mypy>=0.800",
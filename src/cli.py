@@ -11,8 +11,8 @@ from .models import Process
 from .ip_model import IP
 from .type_model import Type
 
-def main():
-    """Main CLI entry point"""
+def main(argv=None):
+    """Main CLI entry point (parses argv, defaulting to sys.argv[1:])"""
     parser = argparse.ArgumentParser(description="IPLM - IP Management System")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -53,7 +53,7 @@ def main():
     tree_parser.add_argument('--type', help='Show trees for all IPs of a type')
     tree_parser.add_argument('--details', action='store_true', help='Show detailed information')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -72,6 +72,10 @@ def main():
         print(f"Error of type {type(e)}: {e}", file=sys.stderr)
         sys.exit(1)
 
+def _emit(data):
+    """Print a record as indented JSON"""
+    print(json.dumps(data, indent=2, default=str))
+
 def handle_db_command(args):
     """Handle database commands"""
     if args.db_action == 'init':
@@ -110,7 +114,7 @@ def handle_process_command(args):
         name = input("Process name: ")
         process = Process.find_by_name(name)
         if process:
-            print(json.dumps(process.to_dict(), indent=2, default=str))
+            _emit(process.to_dict())
         else:
             print("Process not found", file=sys.stderr)
 
@@ -203,7 +207,7 @@ def handle_ip_command(args):
             ip_data = ip.to_dict()
             ip_data['type'] = ip.get_type().to_dict() if ip.get_type() else None
             ip_data['process'] = ip.get_process().to_dict() if ip.get_process() else None
-            print(json.dumps(ip_data, indent=2, default=str))
+            _emit(ip_data)
         else:
             print("IP not found", file=sys.stderr)
     elif args.ip_action == 'find':
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 class IP:
     """IP model for IP management"""
     
+    __slots__ = ('id', 'name', 'type_id', 'process_id', 'parent_ip_id', 'revision',
+                 'status', 'provider', 'description', 'documentation',
+                 'created_at', 'updated_at')
+    
     def __init__(self, name: str, type_id: int, process_id: int, revision: str = DEFAULT_REVISION,
                  status: str = DEFAULT_STATUS, provider: str = "", parent_ip_id: int = None,
                  description: str = "", documentation: str = "", **kwargs):
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class BaseModel(ABC):
     """Base model class with common database operations"""
     
+    __slots__ = ('id', 'created_at', 'updated_at')
+    
     def __init__(self, **kwargs):
         self.id = kwargs.get('id')
         self.created_at = kwargs.get('created_at')
@@ -53,6 +55,8 @@ class BaseModel(ABC):
 class Process(BaseModel):
     """Process model for IP management"""
     
+    __slots__ = ('name', 'node', 'fab', 'description')
+    
     def __init__(self, name: str, node: str, fab: str, description: str = "", **kwargs):
         super().__init__(**kwargs)
         self.name = name
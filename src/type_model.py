@@ -10,6 +10,9 @@ logger = logging.getLogger(__name__)
 class Type:
     """Type model for IP classification tree"""
     
+    __slots__ = ('id', 'name', 'parent_id', 'path', 'level', 'description',
+                 'created_at', 'updated_at')
+    
     def __init__(self, name: str, parent_id: Optional[int] = None, description: str = "", **kwargs):
         self.id = kwargs.get('id')
         self.name = name
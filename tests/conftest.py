@@ -0,0 +1,173 @@
+"""
+Shared pytest fixtures for the IPLM test suite
+"""
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import MagicMock, create_autospec
+
+
+@contextmanager
+def _stub_cursor():
+    """Stand-in for DatabaseManager.get_cursor that never opens a connection"""
+    yield MagicMock()
+
+
+class _FakeDB:
+    """Controllable stand-in for db_manager.execute_query/execute_update"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Return every canned response to its default"""
+        self.query_result = []
+        self.update_result = 1
+        self.raise_on_query = None
+        self.raise_on_update = None
+        # (query, params) of every execute_update call, for postcondition checks
+        self.updates = []
+
+    def query(self, query, params=None):
+        if self.raise_on_query is not None:
+            raise self.raise_on_query
+        return self.query_result
+
+    def update(self, query, params=None):
+        self.updates.append((query, params))
+        if self.raise_on_update is not None:
+            raise self.raise_on_update
+        return self.update_result
+
+
+_FAKE_DB = _FakeDB()
+
+# db_manager attributes replaced for the whole session; the bound methods are
+# stored once so the per-test guard can compare them by identity
+_DB_STUBS = {
+    'execute_query': _FAKE_DB.query,
+    'execute_update': _FAKE_DB.update,
+    'get_cursor': _stub_cursor,
+}
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _stub_db():
+    """Stub the global db_manager once so no test reaches a real MySQL server
+
+    Tests steer the stubs through the fake_db fixture, or monkeypatch on top
+    of them for behaviour the fake does not cover.
+    """
+    from src.database import db_manager
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name, stub in _DB_STUBS.items():
+            mp.setattr(db_manager, name, stub)
+        yield db_manager
+
+
+@pytest.fixture(autouse=True)
+def _verify_db_stubs(_stub_db):
+    """Reset the fake and reinstall any stub a previous test replaced"""
+    _FAKE_DB.reset()
+    for name, stub in _DB_STUBS.items():
+        if getattr(_stub_db, name) is not stub:
+            setattr(_stub_db, name, stub)
+
+
+@pytest.fixture
+def fake_db():
+    """The fake behind db_manager's execute methods, reset for this test"""
+    return _FAKE_DB
+
+
+# src.cli symbols replaced by autospec'd mocks in the CLI tests
+CLI_MOCKED = ('db_manager', 'ip_manager', 'Process', 'Type', 'IP')
+
+
+@pytest.fixture(scope='class')
+def cli_env():
+    """Build one autospec'd mock per src.cli symbol for a test class"""
+    import src.cli
+
+    templates = {}
+    instances = {}
+    for name in CLI_MOCKED:
+        target = getattr(src.cli, name)
+        templates[name] = create_autospec(target, spec_set=True)
+        if isinstance(target, type):
+            instances[name] = templates[name].return_value
+    return templates, instances
+
+
+@pytest.fixture
+def cli_mocks(cli_env, monkeypatch):
+    """Patch src.cli symbols with the class templates, reset after each test
+
+    copy.copy() of a mock shares its child mocks, so the templates are reset
+    in place instead of being copied per test.
+    """
+    import src.cli
+
+    templates, instances = cli_env
+    for name, template in templates.items():
+        monkeypatch.setattr(src.cli, name, template)
+    yield templates
+
+    for name, template in templates.items():
+        template.reset_mock(return_value=True, side_effect=True)
+        if name in instances:
+            # Resetting return_value drops the instance spec, so restore it
+            instances[name].reset_mock(return_value=True, side_effect=True)
+            template.return_value = instances[name]
+
+
+# Canonical processes table row, imported by the Process model tests and
+# benchmarks (from conftest import PROCESS_ROW) for their parametrize tables
+PROCESS_ROW = {
+    'id': 123,
+    'name': 'Test_Process',
+    'node': '28nm',
+    'fab': 'TSMC',
+    'description': 'Test process description',
+    'created_at': '2023-01-01 00:00:00',
+    'updated_at': '2023-01-01 00:00:00'
+}
+
+
+@pytest.fixture(scope='session')
+def ip_row():
+    """A full ips table row as returned by db_manager.execute_query"""
+    return {
+        'id': 123,
+        'name': 'Test_IP',
+        'type_id': 1,
+        'process_id': 2,
+        'parent_ip_id': None,
+        'revision': '1.0',
+        'status': 'alpha',
+        'provider': 'Test_Provider',
+        'description': 'Test IP description',
+        'documentation': 'https://example.com',
+        'created_at': '2023-01-01 00:00:00',
+        'updated_at': '2023-01-01 00:00:00'
+    }
+
+
+@pytest.fixture(scope='session')
+def ip_rows(ip_row):
+    """Two distinct ips table rows"""
+    return [
+        dict(ip_row, id=1, name='IP1', type_id=1, process_id=1, provider='Provider1',
+             description='IP 1'),
+        dict(ip_row, id=2, name='IP2', type_id=2, process_id=2, revision='2.0',
+             status='beta', provider='Provider2', description='IP 2'),
+    ]
+
+
+@pytest.fixture(scope='module')
+def ip_obj(ip_row):
+    """An IP built from ip_row; only for tests that do not modify it"""
+    from src.ip_model import IP
+
+    return IP.from_dict(ip_row)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import pytest
+from unittest.mock import MagicMock
 
 import sys
 import os
@@ -12,10 +13,28 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
 from src.core_methods import ip_manager
 from src import ip_model as ip_module
 from src import type_model as type_module
-from src import models as process_module
 from src.database import db_manager
 
 
+# Rows shaped like DB output for IP.from_dict
+_ROWS = [
+    {
+        "id": 1,
+        "name": "IP_A",
+        "type_id": 10,
+        "process_id": 100,
+        "parent_ip_id": None,
+        "revision": "1.0",
+        "status": "alpha",
+        "provider": "Prov",
+        "description": "",
+        "documentation": "",
+        "created_at": None,
+        "updated_at": None,
+    }
+]
+
+
 @pytest.fixture
 def reset_mocks(monkeypatch):
     # Ensure execute_query and execute_update are harmless by default
@@ -25,40 +44,20 @@ def reset_mocks(monkeypatch):
 
 
 def test_find_builds_query_and_returns_ips(reset_mocks, monkeypatch):
-    captured = {"query": None, "params": None}
-
-    def fake_execute_query(query, params=None):
-        captured["query"] = query
-        captured["params"] = params
-        # Return rows shaped like DB output for IP.from_dict
-        return [
-            {
-                "id": 1,
-                "name": "IP_A",
-                "type_id": 10,
-                "process_id": 100,
-                "parent_ip_id": None,
-                "revision": "1.0",
-                "status": "alpha",
-                "provider": "Prov",
-                "description": "",
-                "documentation": "",
-                "created_at": None,
-                "updated_at": None,
-            }
-        ]
-
-    monkeypatch.setattr(db_manager, "execute_query", fake_execute_query, raising=True)
+    mock_q = MagicMock(return_value=_ROWS)
+    monkeypatch.setattr(db_manager, "execute_query", mock_q, raising=True)
 
     ips = ip_manager.find(type_name="CPU", process_name="SoC_1", status="alpha")
 
     assert len(ips) == 1
-    assert captured["query"] is not None and "SELECT i.* FROM ips i" in captured["query"]
+    mock_q.assert_called_once()
+    query, params = mock_q.call_args.args
+    assert "SELECT i.* FROM ips i" in query
     # Ensure joins applied
-    assert "JOIN types t" in captured["query"]
-    assert "JOIN processes p" in captured["query"]
+    assert "JOIN types t" in query
+    assert "JOIN processes p" in query
     # Ensure params are bound in order
-    assert captured["params"] == ("CPU", "SoC_1", "alpha")
+    assert params == ("CPU", "SoC_1", "alpha")
 
 
 def test_find_by_type_tree_includes_descendants(reset_mocks, monkeypatch):
@@ -72,18 +71,15 @@ def test_find_by_type_tree_includes_descendants(reset_mocks, monkeypatch):
 
     monkeypatch.setattr(type_module.Type, "find_by_name", staticmethod(lambda n: DummyType(1)), raising=True)
 
-    captured = {"params": None}
-
-    def fake_execute_query(query, params=None):
-        captured["params"] = params
-        return []
-
-    monkeypatch.setattr(db_manager, "execute_query", fake_execute_query, raising=True)
+    mock_q = MagicMock(return_value=[])
+    monkeypatch.setattr(db_manager, "execute_query", mock_q, raising=True)
 
     ips = ip_manager.find_by_type_tree("Digital", include_descendants=True)
     assert isinstance(ips, list)
     # Should query with IN of 3 ids
-    assert captured["params"] == (1, 2, 3)
+    query, params = mock_q.call_args.args
+    assert "type_id IN (%s,%s,%s)" in query
+    assert params == (1, 2, 3)
 
 
 def test_update_calls_save(reset_mocks, monkeypatch):
@@ -203,17 +199,12 @@ def test_pack_collects_related(reset_mocks, monkeypatch):
 
 
 def test_fetch_calls_find_by_name(reset_mocks, monkeypatch):
-    marker = {"called": False}
-
-    def fake_fbn(name):
-        marker["called"] = True
-        return object()
-
-    monkeypatch.setattr(ip_module.IP, "find_by_name", staticmethod(fake_fbn), raising=True)
+    mock_fbn = MagicMock(return_value=object())
+    monkeypatch.setattr(ip_module.IP, "find_by_name", mock_fbn, raising=True)
 
     obj = ip_manager.fetch("SomeIP")
-    assert marker["called"] is True
-    assert obj is not None
+    mock_fbn.assert_called_once_with("SomeIP")
+    assert obj is mock_fbn.return_value
 
 
 def test_add_child_ip_calls_add_child(reset_mocks, monkeypatch):
@@ -299,7 +290,7 @@ def test_get_ip_hierarchy_builds_tree(reset_mocks, monkeypatch):
     assert hierarchy["children"][1]["name"] == "Child2"
 
 
-def test_show_ip_tree_calls_print_tree(reset_mocks, monkeypatch, capsys):
+def test_show_ip_tree_format(reset_mocks, monkeypatch, capsys):
     class DummyType:
         def __init__(self, name):
             self.name = name
@@ -325,33 +316,24 @@ def test_show_ip_tree_calls_print_tree(reset_mocks, monkeypatch, capsys):
 
     ip_manager.show_ip_tree("TestIP")
     captured = capsys.readouterr()
-    assert "IP Tree for 'TestIP':" in captured.out
-    assert "├─ TestIP (CPU) - production" in captured.out
+    assert captured.out.splitlines() == [
+        "IP Tree for 'TestIP':",
+        "=" * 50,
+        "├─ TestIP (CPU) - production",
+    ]
 
 
 def test_show_ip_tree_all_roots(reset_mocks, monkeypatch, capsys):
-    class DummyType:
-        def __init__(self, name):
-            self.name = name
-
-    class DummyIP:
-        def __init__(self, name, id_=1):
-            self.id = id_
-            self.name = name
-            self.type = DummyType("CPU")
-            self.status = "production"
+    dummy_ips = [object(), object()]
+    printed = []
 
-        def get_type(self):
-            return self.type
-
-        def get_children(self):
-            return []
+    def record(ip, level=0, show_details=False):
+        printed.append((ip, level, show_details))
 
-    dummy_ips = [DummyIP("Root1"), DummyIP("Root2")]
     monkeypatch.setattr(ip_module.IP, "find_roots", staticmethod(lambda: dummy_ips), raising=True)
+    monkeypatch.setattr(ip_manager, "_print_ip_tree", record, raising=True)
 
     ip_manager.show_ip_tree()
-    captured = capsys.readouterr()
-    assert "All IP Trees:" in captured.out
-    assert "├─ Root1 (CPU) - production" in captured.out
-    assert "├─ Root2 (CPU) - production" in captured.out
+    assert printed == [(dummy_ips[0], 0, False), (dummy_ips[1], 0, False)]
+    # Header, then a blank line after each (stubbed) tree
+    assert capsys.readouterr().out.splitlines() == ["All IP Trees:", "=" * 50, "", ""]
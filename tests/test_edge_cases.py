@@ -3,189 +3,95 @@
 Tests for edge cases and error conditions
 """
 import pytest
-import sys
-import os
-from unittest.mock import Mock, patch
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+from types import SimpleNamespace
+from mysql.connector import Error
 
 from src.models import Process
 from src.type_model import Type
 from src.ip_model import IP
 from src.core_methods import IPManager
-from src.database import db_manager
+from src.database import DatabaseManager, db_manager
+
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+# Payloads shared by the string edge-case tests
+_LARGE_STR = "x" * 10_000
+_UNICODE_STR = "测试_IP_管理_系统_🚀"
+_SPECIAL_NAME = "IP-Name_With.Special@Characters#123"
+
+
+def _patch_static(monkeypatch, cls, name, fn):
+    """Patch a static lookup method on a model class for one test"""
+    monkeypatch.setattr(cls, name, staticmethod(fn))
+
+
+class _Stub:
+    """Model class stand-in whose lookups never find anything"""
+    
+    @staticmethod
+    def find_by_name(name):
+        return None
+    
+    @staticmethod
+    def find_by_id(id):
+        return None
+
 
 @pytest.fixture
-def reset_mocks(monkeypatch):
-    """Reset database mocks for each test"""
-    monkeypatch.setattr(db_manager, "execute_query", lambda q, p=None: [], raising=True)
-    monkeypatch.setattr(db_manager, "execute_update", lambda q, p=None: 1, raising=True)
-    return monkeypatch
+def patched_core(monkeypatch):
+    """Replace the model classes used by src.core_methods with stubs"""
+    from src import core_methods
+    
+    stubs = SimpleNamespace(IP=_Stub, Process=_Stub, Type=_Stub)
+    for name, stub in vars(stubs).items():
+        monkeypatch.setattr(core_methods, name, stub)
+    return stubs
+
+
+@pytest.fixture(scope="session")
+def ip_manager():
+    """One IPManager shared by every test; it holds no per-test state"""
+    return IPManager()
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions"""
     
-    def test_process_creation_empty_strings(self):
-        """Test Process creation with empty strings"""
-        process = Process(
-            name="",
-            node="",
-            fab="",
-            description=""
-        )
-        
-        assert process.name == ""
-        assert process.node == ""
-        assert process.fab == ""
-        assert process.description == ""
-    
-    def test_process_creation_none_values(self):
-        """Test Process creation with None values"""
-        process = Process(
-            name="Test",
-            node="28nm",
-            fab="TSMC",
-            description=None
-        )
-        
-        assert process.name == "Test"
-        assert process.node == "28nm"
-        assert process.fab == "TSMC"
-        assert process.description is None
-    
-    def test_type_creation_negative_level(self):
-        """Test Type creation with negative level"""
-        type_obj = Type(
-            name="Test_Type",
-            level=-1
-        )
-        
-        assert type_obj.level == -1
-    
-    def test_type_creation_empty_path(self):
-        """Test Type creation with empty path"""
-        type_obj = Type(
-            name="Test_Type",
-            path=""
-        )
-        
-        assert type_obj.path == ""
-    
-    def test_ip_creation_empty_strings(self):
-        """Test IP creation with empty strings"""
-        ip = IP(
-            name="",
-            type_id=1,
-            process_id=2,
-            revision="",
-            status="alpha",
-            provider="",
-            description="",
-            documentation=""
-        )
-        
-        assert ip.name == ""
-        assert ip.revision == ""
-        assert ip.provider == ""
-        assert ip.description == ""
-        assert ip.documentation == ""
-    
-    def test_ip_creation_zero_ids(self):
-        """Test IP creation with zero IDs"""
-        ip = IP(
-            name="Test_IP",
-            type_id=0,
-            process_id=0
-        )
-        
-        assert ip.type_id == 0
-        assert ip.process_id == 0
-    
-    def test_ip_creation_negative_ids(self):
-        """Test IP creation with negative IDs"""
-        ip = IP(
-            name="Test_IP",
-            type_id=-1,
-            process_id=-2
-        )
-        
-        assert ip.type_id == -1
-        assert ip.process_id == -2
-    
-    def test_ip_invalid_status_alpha(self):
-        """Test IP with valid alpha status"""
-        ip = IP(
-            name="Test_IP",
-            type_id=1,
-            process_id=2,
-            status="alpha"
-        )
-        
-        assert ip.status == "alpha"
-    
-    def test_ip_invalid_status_beta(self):
-        """Test IP with valid beta status"""
-        ip = IP(
-            name="Test_IP",
-            type_id=1,
-            process_id=2,
-            status="beta"
-        )
-        
-        assert ip.status == "beta"
-    
-    def test_ip_invalid_status_production(self):
-        """Test IP with valid production status"""
-        ip = IP(
-            name="Test_IP",
-            type_id=1,
-            process_id=2,
-            status="production"
-        )
-        
-        assert ip.status == "production"
-    
-    def test_ip_invalid_status_obsolete(self):
-        """Test IP with valid obsolete status"""
-        ip = IP(
-            name="Test_IP",
-            type_id=1,
-            process_id=2,
-            status="obsolete"
-        )
-        
-        assert ip.status == "obsolete"
-    
-    def test_ip_invalid_status_case_sensitive(self):
-        """Test IP with case-sensitive invalid status"""
-        with pytest.raises(ValueError, match="Invalid status"):
-            IP(
-                name="Test_IP",
-                type_id=1,
-                process_id=2,
-                status="Alpha"  # Should be lowercase
-            )
-    
-    def test_ip_invalid_status_empty(self):
-        """Test IP with empty status"""
+    @pytest.mark.parametrize("model_cls, kwargs", [
+        (Process, dict(name="", node="", fab="", description="")),
+        (Process, dict(name="Test", node="28nm", fab="TSMC", description=None)),
+        (Process, dict(name=_LARGE_STR, node=_LARGE_STR, fab=_LARGE_STR, description=_LARGE_STR)),
+        (Process, dict(name=_UNICODE_STR, node="28nm", fab="TSMC", description=_UNICODE_STR)),
+        (Process, dict(name=_SPECIAL_NAME, node="28nm", fab="TSMC")),
+        (Type, dict(name="Test_Type", level=-1)),
+        (Type, dict(name="Test_Type", path="")),
+        (IP, dict(name="", type_id=1, process_id=2, revision="", status="alpha",
+                  provider="", description="", documentation="")),
+        (IP, dict(name="Test_IP", type_id=0, process_id=0)),
+        (IP, dict(name="Test_IP", type_id=-1, process_id=-2)),
+    ], ids=[
+        "process_empty_strings", "process_none_description", "process_large_strings",
+        "process_unicode", "process_special_characters", "type_negative_level",
+        "type_empty_path", "ip_empty_strings", "ip_zero_ids", "ip_negative_ids",
+    ])
+    def test_model_creation_roundtrip(self, model_cls, kwargs):
+        """Test models keep unusual constructor values as given"""
+        obj = model_cls(**kwargs)
+        
+        assert {key: getattr(obj, key) for key in kwargs} == kwargs
+    
+    @pytest.mark.parametrize("status", ["alpha", "beta", "production", "obsolete"])
+    def test_ip_valid_status(self, status):
+        """Test IP accepts each valid status"""
+        ip = IP(name="Test_IP", type_id=1, process_id=2, status=status)
+        
+        assert ip.status == status
+    
+    @pytest.mark.parametrize("status", ["Alpha", "", None], ids=["case_sensitive", "empty", "none"])
+    def test_ip_invalid_status(self, status):
+        """Test IP rejects invalid statuses"""
         with pytest.raises(ValueError, match="Invalid status"):
-            IP(
-                name="Test_IP",
-                type_id=1,
-                process_id=2,
-                status=""
-            )
-    
-    def test_ip_invalid_status_none(self):
-        """Test IP with None status"""
-        with pytest.raises(ValueError, match="Invalid status"):
-            IP(
-                name="Test_IP",
-                type_id=1,
-                process_id=2,
-                status=None
-            )
+            IP(name="Test_IP", type_id=1, process_id=2, status=status)
     
     def test_type_path_update_with_none_parent(self):
         """Test Type path update with None parent"""
@@ -200,7 +106,7 @@ class TestEdgeCases:
         def mock_find_by_id(id):
             return None
         
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
+        _patch_static(monkeypatch, Type, "find_by_id", mock_find_by_id)
         
         type_obj = Type(name="Child_Type", parent_id=999)
         type_obj._update_path_and_level()
@@ -220,14 +126,12 @@ class TestEdgeCases:
         def mock_find_by_id(id):
             raise Exception("Database error")
         
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
+        _patch_static(monkeypatch, Type, "find_by_id", mock_find_by_id)
         
         type_obj = Type(name="Test_Type", id=1)
-        with pytest.raises(Exception) as excinfo:
-            result = type_obj._parent_changed()
-            assert result is False
-        assert "Database error" in str(excinfo.value)
-            
+        with pytest.raises(Exception, match="Database error"):
+            type_obj._parent_changed()
+    
     def test_type_find_descendants_empty_path(self):
         """Test Type find_descendants with empty path"""
         type_obj = Type(name="Test_Type", path="")
@@ -254,7 +158,7 @@ class TestEdgeCases:
         def mock_execute_query(query, params):
             raise Exception("Database error")
         
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
+        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query)
         
         ip = IP(name="Test_IP", type_id=1, process_id=2, id=1)
         result = ip.get_children()
@@ -263,18 +167,18 @@ class TestEdgeCases:
     
     def test_ip_get_all_descendants_recursive(self, monkeypatch):
         """Test IP get_all_descendants with recursive structure"""
+        children_map = {
+            "Parent": [
+                IP(name="Child1", type_id=1, process_id=2, id=2),
+                IP(name="Child2", type_id=1, process_id=2, id=3),
+            ],
+            "Child1": [IP(name="Grandchild", type_id=1, process_id=2, id=4)],
+        }
+        
         def mock_get_children(self):
-            if self.name == "Parent":
-                child1 = IP(name="Child1", type_id=1, process_id=2, id=2)
-                child2 = IP(name="Child2", type_id=1, process_id=2, id=3)
-                return [child1, child2]
-            elif self.name == "Child1":
-                grandchild = IP(name="Grandchild", type_id=1, process_id=2, id=4)
-                return [grandchild]
-            else:
-                return []
-        
-        monkeypatch.setattr(IP, "get_children", mock_get_children, raising=True)
+            return children_map.get(self.name, [])
+        
+        monkeypatch.setattr(IP, "get_children", mock_get_children)
         
         parent = IP(name="Parent", type_id=1, process_id=2, id=1)
         result = parent.get_all_descendants()
@@ -292,7 +196,7 @@ class TestEdgeCases:
         
         assert result == ip
 
-    @pytest.mark.skip(reason="This test goes to the infinite loop that is not properly handled yet, skipping for now")
+    @pytest.mark.xfail(reason="get_root_ancestor loops forever on circular parents", strict=False, run=False)
     def test_ip_get_root_ancestor_circular_reference(self, monkeypatch):
         """Test IP get_root_ancestor with circular reference"""
         def mock_get_parent(self):
@@ -305,7 +209,7 @@ class TestEdgeCases:
                 return child
             return None
         
-        monkeypatch.setattr(IP, "get_parent", mock_get_parent, raising=True)
+        monkeypatch.setattr(IP, "get_parent", mock_get_parent)
         
         child = IP(name="Child", type_id=1, process_id=2, parent_ip_id=2)
         result = child.get_root_ancestor()
@@ -313,176 +217,77 @@ class TestEdgeCases:
         # Should return the child itself to avoid infinite loop
         assert result.name == "Child"
     
-    def test_ip_manager_find_empty_criteria(self, reset_mocks, monkeypatch):
+    def test_ip_manager_find_empty_criteria(self, ip_manager):
         """Test IPManager find with empty criteria"""
-        ip_manager = IPManager()
+        result = ip_manager.find()
         
-        with patch('src.core_methods.IP') as mock_ip:
-            mock_ip.find_all.return_value = []
-            result = ip_manager.find()
-            
-            assert result == []
+        assert result == []
     
-    def test_ip_manager_find_invalid_criteria(self, reset_mocks, monkeypatch):
+    def test_ip_manager_find_invalid_criteria(self, ip_manager):
         """Test IPManager find with invalid criteria"""
-        ip_manager = IPManager()
+        result = ip_manager.find(invalid_field="value")
         
-        with patch('src.core_methods.IP') as mock_ip:
-            mock_ip.find_all.return_value = []
-            result = ip_manager.find(invalid_field="value")
-            
-            assert result == []
+        assert result == []
     
-    def test_ip_manager_update_invalid_field(self, reset_mocks, monkeypatch):
-        """Test IPManager update with invalid field"""
-        def mock_find_by_name(name):
-            ip = IP(name="Test_IP", type_id=1, process_id=2)
-            ip.invalid_field = None
-            return ip
+    @pytest.mark.parametrize("field", ["invalid_field", "id"],
+                             ids=["unknown_field", "disallowed_field"])
+    def test_ip_manager_update_invalid_field(self, ip_manager, monkeypatch, field):
+        """Test IPManager update ignores unknown fields and fields outside the allow-list"""
+        ip = IP(name="Test_IP", type_id=1, process_id=2)
         
-        monkeypatch.setattr(IP, "find_by_name", staticmethod(mock_find_by_name), raising=True)
+        _patch_static(monkeypatch, IP, "find_by_name", lambda name: ip)
         
-        ip_manager = IPManager()
-        result = ip_manager.update("Test_IP", invalid_field="value")
+        result = ip_manager.update("Test_IP", **{field: 5})
         
         assert result is False  # Should fail because of internal errors
-    
-    def test_ip_manager_show_ip_tree_not_found(self, capsys):
-        """Test IPManager show_ip_tree with IP not found"""
-        with patch('src.core_methods.IP') as mock_ip:
-            mock_ip.find_by_name.return_value = None
-            
-            ip_manager = IPManager()
-            ip_manager.show_ip_tree("NonExistent_IP")
-            
-            captured = capsys.readouterr()
-            assert "IP 'NonExistent_IP' not found" in captured.out
-    
-    def test_ip_manager_show_ip_tree_by_process_not_found(self, capsys):
-        """Test IPManager show_ip_tree_by_process with process not found"""
-        with patch('src.core_methods.Process') as mock_process:
-            mock_process.find_by_name.return_value = None
-            
-            ip_manager = IPManager()
-            ip_manager.show_ip_tree_by_process("NonExistent_Process")
-            
-            captured = capsys.readouterr()
-            assert "Process 'NonExistent_Process' not found" in captured.out
-    
-    def test_ip_manager_show_ip_tree_by_type_not_found(self, capsys):
-        """Test IPManager show_ip_tree_by_type with type not found"""
-        with patch('src.core_methods.Type') as mock_type:
-            mock_type.find_by_name.return_value = None
-            
-            ip_manager = IPManager()
-            ip_manager.show_ip_tree_by_type("NonExistent_Type")
-            
-            captured = capsys.readouterr()
-            assert "Type 'NonExistent_Type' not found" in captured.out
-    
-    def test_database_manager_execute_query_error(self, monkeypatch):
-        """Test DatabaseManager execute_query with error"""
-        from mysql.connector import Error
-        
+        assert getattr(ip, field, None) is None
+    
+    @pytest.mark.parametrize("method, kind, missing", [
+        ("show_ip_tree", "IP", "NonExistent_IP"),
+        ("show_ip_tree_by_process", "Process", "NonExistent_Process"),
+        ("show_ip_tree_by_type", "Type", "NonExistent_Type"),
+    ])
+    def test_ip_manager_show_tree_not_found(self, method, kind, missing, ip_manager, patched_core, capsys):
+        """Test IPManager show_ip_tree variants with the lookup target not found"""
+        getattr(ip_manager, method)(missing)
+        
+        captured = capsys.readouterr()
+        assert f"{kind} '{missing}' not found" in captured.out
+    
+    @pytest.mark.parametrize("method, query", [
+        ("execute_query", "SELECT 1"),
+        ("execute_update", "INSERT INTO test VALUES (1)"),
+    ])
+    def test_database_manager_execute_error(self, method, query, monkeypatch):
+        """Test DatabaseManager execute methods with a cursor error"""
         def mock_get_cursor():
             raise Error("Database connection error")
         
-        monkeypatch.setattr(db_manager, "get_cursor", mock_get_cursor, raising=True)
+        # The session stub replaces the execute methods on the global db_manager
+        manager = DatabaseManager()
+        monkeypatch.setattr(manager, "get_cursor", mock_get_cursor)
         
         with pytest.raises(Error):
-            db_manager.execute_query("SELECT 1")
-    
-    def test_database_manager_execute_update_error(self, monkeypatch):
-        """Test DatabaseManager execute_update with error"""
-        from mysql.connector import Error
-        
-        def mock_get_cursor():
-            raise Error("Database connection error")
-        
-        monkeypatch.setattr(db_manager, "get_cursor", mock_get_cursor, raising=True)
-        
-        with pytest.raises(Error):
-            db_manager.execute_update("INSERT INTO test VALUES (1)")
-    
-    def test_process_save_database_error(self, monkeypatch):
-        """Test Process save with database error"""
-        def mock_execute_update(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        
-        process = Process(name="Test_Process", node="28nm", fab="TSMC")
-        result = process.save()
-        
-        assert result is False
-    
-    def test_type_save_database_error(self, monkeypatch):
-        """Test Type save with database error"""
+            getattr(manager, method)(query)
+    
+    @pytest.mark.parametrize("model_cls, kwargs", [
+        (Process, dict(name="Test_Process", node="28nm", fab="TSMC")),
+        (Type, dict(name="Test_Type")),
+        (IP, dict(name="Test_IP", type_id=1, process_id=2)),
+    ], ids=["process", "type", "ip"])
+    def test_save_database_error(self, model_cls, kwargs, monkeypatch):
+        """Test model save with database error"""
         def mock_execute_update(query, params):
             raise Exception("Database error")
         
         def mock_find_by_id(id):
             return None
         
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
+        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update)
+        if model_cls is Type:
+            # Type.save resolves its parent before writing
+            _patch_static(monkeypatch, Type, "find_by_id", mock_find_by_id)
         
-        type_obj = Type(name="Test_Type")
-        result = type_obj.save()
+        result = model_cls(**kwargs).save()
         
         assert result is False
-    
-    def test_ip_save_database_error(self, monkeypatch):
-        """Test IP save with database error"""
-        def mock_execute_update(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        
-        ip = IP(name="Test_IP", type_id=1, process_id=2)
-        result = ip.save()
-        
-        assert result is False
-    
-    def test_large_string_values(self):
-        """Test models with very large string values"""
-        large_string = "x" * 10000
-        
-        process = Process(
-            name=large_string,
-            node=large_string,
-            fab=large_string,
-            description=large_string
-        )
-        
-        assert process.name == large_string
-        assert process.node == large_string
-        assert process.fab == large_string
-        assert process.description == large_string
-    
-    def test_unicode_strings(self):
-        """Test models with unicode strings"""
-        unicode_string = "测试_IP_管理_系统_🚀"
-        
-        process = Process(
-            name=unicode_string,
-            node="28nm",
-            fab="TSMC",
-            description=unicode_string
-        )
-        
-        assert process.name == unicode_string
-        assert process.description == unicode_string
-    
-    def test_special_characters_in_names(self):
-        """Test models with special characters in names"""
-        special_name = "IP-Name_With.Special@Characters#123"
-        
-        process = Process(
-            name=special_name,
-            node="28nm",
-            fab="TSMC"
-        )
-        
-        assert process.name == special_name
-
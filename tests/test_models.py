@@ -3,22 +3,40 @@
 Tests for models.py - Process model and BaseModel
 """
 import pytest
-import sys
-import os
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
 
+from conftest import PROCESS_ROW
 from src.models import Process
-from src.database import db_manager
+
+# Canned processes table rows returned by the fake database
+_ROWS = [
+    dict(PROCESS_ROW, id=1, name='Process1', description='Process 1'),
+    dict(PROCESS_ROW, id=2, name='Process2', node='7nm', fab='Samsung', description='Process 2'),
+]
 
 
 @pytest.fixture
-def reset_mocks(monkeypatch):
-    """Reset database mocks for each test"""
-    monkeypatch.setattr(db_manager, "execute_query", lambda q, p=None: [], raising=True)
-    monkeypatch.setattr(db_manager, "execute_update", lambda q, p=None: 1, raising=True)
-    return monkeypatch
+def sample_process():
+    """A fresh, unsaved Process"""
+    return Process(
+        name="Test_Process",
+        node="28nm",
+        fab="TSMC",
+        description="Test process description"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_process_with_id():
+    """A stored Process built once per module; tests must not modify it"""
+    return Process(
+        name="Test_Process",
+        node="28nm",
+        fab="TSMC",
+        description="Test process description",
+        id=123,
+        created_at="2023-01-01 00:00:00",
+        updated_at="2023-01-01 00:00:00"
+    )
 
 
 class TestProcess:
@@ -41,62 +59,23 @@ class TestProcess:
         assert process.created_at is None
         assert process.updated_at is None
     
-    def test_process_creation_with_kwargs(self):
+    def test_process_creation_with_kwargs(self, sample_process_with_id):
         """Test Process creation with additional kwargs"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description",
-            id=1,
-            created_at="2023-01-01 00:00:00",
-            updated_at="2023-01-01 00:00:00"
-        )
-        
-        assert process.id == 1
-        assert process.created_at == "2023-01-01 00:00:00"
-        assert process.updated_at == "2023-01-01 00:00:00"
+        assert sample_process_with_id.id == 123
+        assert sample_process_with_id.created_at == "2023-01-01 00:00:00"
+        assert sample_process_with_id.updated_at == "2023-01-01 00:00:00"
     
-    def test_to_dict(self):
+    def test_to_dict(self, sample_process_with_id):
         """Test Process to_dict method"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description",
-            id=1,
-            created_at="2023-01-01 00:00:00",
-            updated_at="2023-01-01 00:00:00"
-        )
-        
-        result = process.to_dict()
-        expected = {
-            'id': 1,
-            'name': 'Test_Process',
-            'node': '28nm',
-            'fab': 'TSMC',
-            'description': 'Test process description',
-            'created_at': '2023-01-01 00:00:00',
-            'updated_at': '2023-01-01 00:00:00'
-        }
+        result = sample_process_with_id.to_dict()
         
-        assert result == expected
+        assert result == PROCESS_ROW
     
     def test_from_dict(self):
         """Test Process from_dict method"""
-        data = {
-            'id': 1,
-            'name': 'Test_Process',
-            'node': '28nm',
-            'fab': 'TSMC',
-            'description': 'Test process description',
-            'created_at': '2023-01-01 00:00:00',
-            'updated_at': '2023-01-01 00:00:00'
-        }
+        process = Process.from_dict(PROCESS_ROW)
         
-        process = Process.from_dict(data)
-        
-        assert process.id == 1
+        assert process.id == 123
         assert process.name == 'Test_Process'
         assert process.node == '28nm'
         assert process.fab == 'TSMC'
@@ -123,282 +102,98 @@ class TestProcess:
         assert process.created_at is None
         assert process.updated_at is None
     
-    def test_save_new_process(self, reset_mocks, monkeypatch):
-        """Test saving a new process"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description"
-        )
-        
-        # Mock the database responses
-        def mock_execute_update(query, params):
-            return 1
-        
-        def mock_execute_query(query, params=None):
-            if "LAST_INSERT_ID" in query:
-                return [{'id': 123}]
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = process.save()
-        
-        assert result is True
-        assert process.id == 123
-    
-    def test_save_existing_process(self, reset_mocks, monkeypatch):
-        """Test saving an existing process"""
+    @pytest.mark.parametrize("extra, statement, params", [
+        ({}, "INSERT", ("Test_Process", "28nm", "TSMC", "Test process description")),
+        ({"id": 123}, "UPDATE",
+         ("Test_Process", "28nm", "TSMC", "Test process description", 123)),
+    ], ids=["insert", "update"])
+    def test_save(self, fake_db, extra, statement, params):
+        """Test save dispatches a single INSERT or UPDATE with the Process fields"""
+        fake_db.query_result = [{'id': 123}]
         process = Process(
             name="Test_Process",
             node="28nm",
             fab="TSMC",
             description="Test process description",
-            id=123
+            **extra
         )
         
-        def mock_execute_update(query, params):
-            return 1
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        
         result = process.save()
         
         assert result is True
+        assert process.id == 123
+        assert len(fake_db.updates) == 1
+        query, sent = fake_db.updates[0]
+        assert query.strip().startswith(statement)
+        assert sent == params
     
-    def test_save_database_error(self, reset_mocks, monkeypatch):
+    def test_save_database_error(self, sample_process, fake_db):
         """Test save method with database error"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description"
-        )
+        fake_db.raise_on_update = Exception("Database error")
         
-        def mock_execute_update(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        
-        result = process.save()
+        result = sample_process.save()
         
         assert result is False
     
-    def test_delete_success(self, reset_mocks, monkeypatch):
+    def test_delete_success(self, sample_process_with_id, fake_db):
         """Test successful deletion"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description",
-            id=123
-        )
-        
-        def mock_execute_update(query, params):
-            return 1
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        
-        result = process.delete()
+        result = sample_process_with_id.delete()
         
         assert result is True
     
-    def test_delete_no_id(self):
+    def test_delete_no_id(self, sample_process):
         """Test deletion without ID"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description"
-        )
-        
-        result = process.delete()
+        result = sample_process.delete()
         
         assert result is False
     
-    def test_delete_database_error(self, reset_mocks, monkeypatch):
+    def test_delete_database_error(self, sample_process_with_id, fake_db):
         """Test deletion with database error"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description",
-            id=123
-        )
-        
-        def mock_execute_update(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
+        fake_db.raise_on_update = Exception("Database error")
         
-        result = process.delete()
+        result = sample_process_with_id.delete()
         
         assert result is False
     
-    def test_find_by_id_success(self, reset_mocks, monkeypatch):
-        """Test successful find_by_id"""
-        def mock_execute_query(query, params):
-            return [{
-                'id': 123,
-                'name': 'Test_Process',
-                'node': '28nm',
-                'fab': 'TSMC',
-                'description': 'Test process description',
-                'created_at': '2023-01-01 00:00:00',
-                'updated_at': '2023-01-01 00:00:00'
-            }]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_id(123)
-        
-        assert result is not None
-        assert result.id == 123
-        assert result.name == 'Test_Process'
-    
-    def test_find_by_id_not_found(self, reset_mocks, monkeypatch):
-        """Test find_by_id when not found"""
-        def mock_execute_query(query, params):
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_id(123)
-        
-        assert result is None
-    
-    def test_find_by_id_database_error(self, reset_mocks, monkeypatch):
-        """Test find_by_id with database error"""
-        def mock_execute_query(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_id(123)
-        
-        assert result is None
-    
-    def test_find_by_name_success(self, reset_mocks, monkeypatch):
-        """Test successful find_by_name"""
-        def mock_execute_query(query, params):
-            return [{
-                'id': 123,
-                'name': 'Test_Process',
-                'node': '28nm',
-                'fab': 'TSMC',
-                'description': 'Test process description',
-                'created_at': '2023-01-01 00:00:00',
-                'updated_at': '2023-01-01 00:00:00'
-            }]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_name("Test_Process")
-        
-        assert result is not None
-        assert result.id == 123
-        assert result.name == 'Test_Process'
-    
-    def test_find_by_name_not_found(self, reset_mocks, monkeypatch):
-        """Test find_by_name when not found"""
-        def mock_execute_query(query, params):
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_name("NonExistent")
-        
-        assert result is None
-    
-    def test_find_all_success(self, reset_mocks, monkeypatch):
-        """Test successful find_all"""
-        def mock_execute_query(query):
-            return [
-                {
-                    'id': 1,
-                    'name': 'Process1',
-                    'node': '28nm',
-                    'fab': 'TSMC',
-                    'description': 'Process 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                },
-                {
-                    'id': 2,
-                    'name': 'Process2',
-                    'node': '7nm',
-                    'fab': 'Samsung',
-                    'description': 'Process 2',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_all()
-        
-        assert len(result) == 2
-        assert result[0].name == 'Process1'
-        assert result[1].name == 'Process2'
-    
-    def test_find_all_database_error(self, reset_mocks, monkeypatch):
-        """Test find_all with database error"""
-        def mock_execute_query(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_all()
-        
-        assert result == []
-    
-    def test_find_by_fab_success(self, reset_mocks, monkeypatch):
-        """Test successful find_by_fab"""
-        def mock_execute_query(query, params):
-            return [
-                {
-                    'id': 1,
-                    'name': 'Process1',
-                    'node': '28nm',
-                    'fab': 'TSMC',
-                    'description': 'Process 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_fab("TSMC")
-        
-        assert len(result) == 1
-        assert result[0].fab == 'TSMC'
-    
-    def test_find_by_fab_database_error(self, reset_mocks, monkeypatch):
-        """Test find_by_fab with database error"""
-        def mock_execute_query(query, params):
-            raise Exception("Database error")
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Process.find_by_fab("TSMC")
-        
-        assert result == []
-    
-    def test_str_representation(self):
+    @pytest.mark.parametrize("finder, args, rows, expected_names", [
+        (Process.find_by_id, (123,), [PROCESS_ROW], ['Test_Process']),
+        (Process.find_by_name, ("Test_Process",), [PROCESS_ROW], ['Test_Process']),
+        (Process.find_by_fab, ("TSMC",), _ROWS[:1], ['Process1']),
+        (Process.find_all, (), _ROWS, ['Process1', 'Process2']),
+    ], ids=["find_by_id", "find_by_name", "find_by_fab", "find_all"])
+    def test_finder_success(self, fake_db, finder, args, rows, expected_names):
+        """Test successful Process lookups"""
+        fake_db.query_result = rows
+        
+        result = finder(*args)
+        found = result if isinstance(result, list) else [result]
+        
+        assert [process.name for process in found] == expected_names
+        assert [process.id for process in found] == [row['id'] for row in rows]
+    
+    @pytest.mark.parametrize("finder, args", [
+        (Process.find_by_id, (123,)),
+        (Process.find_by_name, ("NonExistent",)),
+    ], ids=["find_by_id", "find_by_name"])
+    def test_finder_not_found(self, fake_db, finder, args):
+        """Test single-row lookups when nothing matches"""
+        assert finder(*args) is None
+    
+    @pytest.mark.parametrize("finder, args, expected", [
+        (Process.find_by_id, (123,), None),
+        (Process.find_by_name, ("Test_Process",), None),
+        (Process.find_by_fab, ("TSMC",), []),
+        (Process.find_all, (), []),
+    ], ids=["find_by_id", "find_by_name", "find_by_fab", "find_all"])
+    def test_finder_database_error(self, fake_db, finder, args, expected):
+        """Test Process lookups swallow database errors"""
+        fake_db.raise_on_query = Exception("Database error")
+        
+        assert finder(*args) == expected
+    
+    def test_str_representation(self, sample_process_with_id):
         """Test string representation"""
-        process = Process(
-            name="Test_Process",
-            node="28nm",
-            fab="TSMC",
-            description="Test process description",
-            id=123
-        )
-        
         expected = "Process(id=123, name='Test_Process', node='28nm', fab='TSMC')"
-        assert str(process) == expected
-        assert repr(process) == expected
+        assert str(sample_process_with_id) == expected
+        assert repr(sample_process_with_id) == expected
 
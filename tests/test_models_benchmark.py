@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Process serialization and lookup
+
+Run with --benchmark-only for pytest-benchmark timings, or with --codspeed
+for pytest-codspeed's instruction counts.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import PROCESS_ROW
+from src.models import Process
+
+
+@pytest.fixture
+def make_row():
+    """Build a processes row from PROCESS_ROW, overridden by keyword arguments"""
+    def _make(**overrides):
+        return {**PROCESS_ROW, **overrides}
+    return _make
+
+
+def test_bench_to_dict(benchmark):
+    """Benchmark Process.to_dict"""
+    process = Process.from_dict(PROCESS_ROW)
+    
+    assert benchmark(process.to_dict) == PROCESS_ROW
+
+
+def test_bench_from_dict(benchmark):
+    """Benchmark Process.from_dict"""
+    process = benchmark(Process.from_dict, PROCESS_ROW)
+    
+    assert process.id == 123
+
+
+def test_bench_find_by_id(benchmark, fake_db):
+    """Benchmark Process.find_by_id"""
+    fake_db.query_result = [PROCESS_ROW]
+    
+    process = benchmark(Process.find_by_id, 123)
+    
+    assert process.id == 123
+
+
+@pytest.mark.parametrize("size", [100, 10_000])
+def test_bench_find_all(benchmark, fake_db, make_row, size):
+    """Benchmark Process.find_all over size rows"""
+    fake_db.query_result = [make_row(id=i, name=f"Process{i}") for i in range(size)]
+    
+    result = benchmark(Process.find_all)
+    
+    assert len(result) == size
@@ -3,144 +3,91 @@
 Tests for type_model.py - Type model
 """
 import pytest
-import sys
-import os
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+from unittest.mock import Mock
 
 from src.type_model import Type
-from src.database import db_manager
+
+# Canned types table rows returned by the fake database
+_ROW = {
+    'id': 123,
+    'name': 'Test_Type',
+    'parent_id': None,
+    'path': 'Test_Type',
+    'level': 0,
+    'description': 'Test type description',
+    'created_at': '2023-01-01 00:00:00',
+    'updated_at': '2023-01-01 00:00:00'
+}
+_ROWS = [
+    dict(_ROW, id=1, name='Type1', path='Type1', description='Type 1'),
+    dict(_ROW, id=2, name='Type2', parent_id=1, path='Type1/Type2', level=1,
+         description='Type 2'),
+]
+
+# to_dict() of a Type built only from a name
+_TYPE_DEFAULTS = {
+    'id': None,
+    'name': 'Test_Type',
+    'parent_id': None,
+    'path': '',
+    'level': 0,
+    'description': '',
+    'created_at': None,
+    'updated_at': None
+}
+
+# Field sets a Type is built from, by constructor kwargs or from_dict
+_TYPE_DATA = [
+    pytest.param(
+        {'name': 'Test_Type', 'parent_id': None, 'description': 'Test type description'},
+        id="new_root"),
+    pytest.param(
+        {'name': 'Child_Type', 'parent_id': 1, 'description': 'Child type description'},
+        id="new_child"),
+    pytest.param(dict(_ROW, id=1), id="stored_root"),
+    pytest.param(
+        dict(_ROW, id=1, parent_id=1, path='Parent/Test_Type', level=1), id="stored_child"),
+    pytest.param({'id': 1, 'name': 'Test_Type', 'parent_id': 1}, id="missing_fields"),
+]
+
+# execute_update params save() sends for make_type(): a root, so path is its name
+_SAVE_PARAMS = ("Test_Type", None, "Test_Type", 0, "Test type description")
+
+
+@pytest.fixture
+def make_type():
+    """Build a Type from common defaults, overridden by keyword arguments"""
+    defaults = dict(name="Test_Type", parent_id=None, description="Test type description")
+    
+    def _make(**overrides):
+        return Type(**{**defaults, **overrides})
+    return _make
 
 
 @pytest.fixture
-def reset_mocks(monkeypatch):
-    """Reset database mocks for each test"""
-    monkeypatch.setattr(db_manager, "execute_query", lambda q, p=None: [], raising=True)
-    monkeypatch.setattr(db_manager, "execute_update", lambda q, p=None: 1, raising=True)
-    return monkeypatch
+def stored_types(monkeypatch):
+    """Serve Type.find_by_id from a dict of id -> Type the test fills in"""
+    types = {}
+    monkeypatch.setattr(Type, "find_by_id", staticmethod(types.get))
+    return types
 
 
 class TestType:
     """Test Type model functionality"""
     
-    def test_type_creation(self):
-        """Test Type object creation"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description"
-        )
-        
-        assert type_obj.name == "Test_Type"
-        assert type_obj.parent_id is None
-        assert type_obj.description == "Test type description"
-        assert type_obj.id is None
-        assert type_obj.path == ""
-        assert type_obj.level == 0
-        assert type_obj.created_at is None
-        assert type_obj.updated_at is None
-    
-    def test_type_creation_with_parent(self):
-        """Test Type creation with parent"""
-        type_obj = Type(
-            name="Child_Type",
-            parent_id=1,
-            description="Child type description"
-        )
+    @pytest.mark.parametrize("data", _TYPE_DATA)
+    def test_type_creation(self, data):
+        """Test Type creation keeps given fields and defaults the rest"""
+        type_obj = Type(**data)
         
-        assert type_obj.name == "Child_Type"
-        assert type_obj.parent_id == 1
-        assert type_obj.description == "Child type description"
+        assert type_obj.to_dict() == {**_TYPE_DEFAULTS, **data}
     
-    def test_type_creation_with_kwargs(self):
-        """Test Type creation with additional kwargs"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description",
-            id=1,
-            path="Test_Type",
-            level=0,
-            created_at="2023-01-01 00:00:00",
-            updated_at="2023-01-01 00:00:00"
-        )
-        
-        assert type_obj.id == 1
-        assert type_obj.path == "Test_Type"
-        assert type_obj.level == 0
-        assert type_obj.created_at == "2023-01-01 00:00:00"
-        assert type_obj.updated_at == "2023-01-01 00:00:00"
-    
-    def test_to_dict(self):
-        """Test Type to_dict method"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=1,
-            description="Test type description",
-            id=1,
-            path="Parent/Test_Type",
-            level=1,
-            created_at="2023-01-01 00:00:00",
-            updated_at="2023-01-01 00:00:00"
-        )
-        
-        result = type_obj.to_dict()
-        expected = {
-            'id': 1,
-            'name': 'Test_Type',
-            'parent_id': 1,
-            'path': 'Parent/Test_Type',
-            'level': 1,
-            'description': 'Test type description',
-            'created_at': '2023-01-01 00:00:00',
-            'updated_at': '2023-01-01 00:00:00'
-        }
-        
-        assert result == expected
-    
-    def test_from_dict(self):
-        """Test Type from_dict method"""
-        data = {
-            'id': 1,
-            'name': 'Test_Type',
-            'parent_id': 1,
-            'path': 'Parent/Test_Type',
-            'level': 1,
-            'description': 'Test type description',
-            'created_at': '2023-01-01 00:00:00',
-            'updated_at': '2023-01-01 00:00:00'
-        }
-        
-        type_obj = Type.from_dict(data)
-        
-        assert type_obj.id == 1
-        assert type_obj.name == 'Test_Type'
-        assert type_obj.parent_id == 1
-        assert type_obj.path == 'Parent/Test_Type'
-        assert type_obj.level == 1
-        assert type_obj.description == 'Test type description'
-        assert type_obj.created_at == '2023-01-01 00:00:00'
-        assert type_obj.updated_at == '2023-01-01 00:00:00'
-    
-    def test_from_dict_with_missing_fields(self):
-        """Test Type from_dict with missing optional fields"""
-        data = {
-            'id': 1,
-            'name': 'Test_Type',
-            'parent_id': 1
-        }
-        
+    @pytest.mark.parametrize("data", _TYPE_DATA)
+    def test_from_dict(self, data):
+        """Test Type from_dict keeps given fields and defaults the rest"""
         type_obj = Type.from_dict(data)
         
-        assert type_obj.id == 1
-        assert type_obj.name == 'Test_Type'
-        assert type_obj.parent_id == 1
-        assert type_obj.path == ''  # Default value
-        assert type_obj.level == 0  # Default value
-        assert type_obj.description == ''  # Default value
-        assert type_obj.created_at is None
-        assert type_obj.updated_at is None
+        assert type_obj.to_dict() == {**_TYPE_DEFAULTS, **data}
     
     def test_update_path_and_level_no_parent(self):
         """Test _update_path_and_level with no parent"""
@@ -150,17 +97,9 @@ class TestType:
         assert type_obj.path == "Root_Type"
         assert type_obj.level == 0
     
-    def test_update_path_and_level_with_parent(self, reset_mocks, monkeypatch):
+    def test_update_path_and_level_with_parent(self, stored_types):
         """Test _update_path_and_level with parent"""
-        def mock_find_by_id(id):
-            if id == 1:
-                parent = Type(name="Parent_Type")
-                parent.path = "Parent_Type"
-                parent.level = 0
-                return parent
-            return None
-        
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
+        stored_types[1] = Type(name="Parent_Type", path="Parent_Type", level=0)
         
         type_obj = Type(name="Child_Type", parent_id=1)
         type_obj._update_path_and_level()
@@ -168,440 +107,119 @@ class TestType:
         assert type_obj.path == "Parent_Type/Child_Type"
         assert type_obj.level == 1
     
-    def test_update_path_and_level_parent_not_found(self, reset_mocks, monkeypatch):
+    def test_update_path_and_level_parent_not_found(self, stored_types):
         """Test _update_path_and_level when parent not found"""
-        def mock_find_by_id(id):
-            return None
-        
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
-        
         type_obj = Type(name="Child_Type", parent_id=999)
         type_obj._update_path_and_level()
         
         assert type_obj.path == "Child_Type"
         assert type_obj.level == 0
     
-    def test_parent_changed_no_id(self):
-        """Test _parent_changed with no ID"""
-        type_obj = Type(name="Test_Type")
-        result = type_obj._parent_changed()
-        
-        assert result is False
-    
-    def test_parent_changed_with_id(self, reset_mocks, monkeypatch):
+    def test_parent_changed_with_id(self, stored_types, make_type):
         """Test _parent_changed with ID"""
-        def mock_find_by_id(id):
-            if id == 1:
-                current = Type(name="Test_Type", parent_id=2)
-                return current
-            return None
+        stored_types[1] = make_type(parent_id=2)
         
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
-        
-        type_obj = Type(name="Test_Type", parent_id=1, id=1)
+        type_obj = make_type(parent_id=1, id=1)
         result = type_obj._parent_changed()
         
         assert result is True
     
-    def test_save_new_type(self, reset_mocks, monkeypatch):
-        """Test saving a new type"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description"
-        )
-        
-        def mock_execute_update(query, params):
-            return 1
-        
-        def mock_execute_query(query, params=None):
-            if "LAST_INSERT_ID" in query:
-                return [{'id': 123}]
-            return []
-        
-        def mock_find_by_id(id):
-            return None
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
-        
-        result = type_obj.save()
-        
-        assert result is True
-        assert type_obj.id == 123
-    
-    def test_save_existing_type(self, reset_mocks, monkeypatch):
-        """Test saving an existing type"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description",
-            id=123
-        )
-        
-        def mock_execute_update(query, params):
-            return 1
-        
-        def mock_find_by_id(id):
-            if id == 123:
-                current = Type(name="Test_Type", parent_id=None, id=123)
-                return current
-            return None
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
-        
-        result = type_obj.save()
-        
-        assert result is True
-    
-    def test_save_database_error(self, reset_mocks, monkeypatch):
-        """Test save method with database error"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description"
-        )
-        
-        def mock_execute_update(query, params):
-            raise Exception("Database error")
-        
-        def mock_find_by_id(id):
-            return None
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(Type, "find_by_id", staticmethod(mock_find_by_id), raising=True)
-        
-        result = type_obj.save()
-        
-        assert result is False
-    
-    def test_delete_success(self, reset_mocks, monkeypatch):
-        """Test successful deletion"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description",
-            id=123
-        )
-        
-        def mock_execute_update(query, params):
-            return 1
-        
-        def mock_find_children(self):
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(Type, "find_children", mock_find_children, raising=True)
-        
-        result = type_obj.delete()
-        
-        assert result is True
-    
-    def test_delete_no_id(self):
-        """Test deletion without ID"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=None,
-            description="Test type description"
-        )
-        
-        result = type_obj.delete()
-        
-        assert result is False
-    
-    def test_delete_with_children(self, reset_mocks, monkeypatch):
-        """Test deletion with children"""
-        type_obj = Type(
-            name="Parent_Type",
-            parent_id=None,
-            description="Parent type description",
-            id=123
-        )
-        
-        child = Type(name="Child_Type", parent_id=123, id=456)
-        
-        def mock_execute_update(query, params):
-            return 1
-        
-        def mock_find_children(self):
-            return [child]
-        
-        def mock_save(self):
-            return True
-        
-        monkeypatch.setattr(db_manager, "execute_update", mock_execute_update, raising=True)
-        monkeypatch.setattr(Type, "find_children", mock_find_children, raising=True)
-        monkeypatch.setattr(Type, "save", mock_save, raising=True)
-        
-        result = type_obj.delete()
-        
-        assert result is True
-        assert child.parent_id is None  # Should be moved to parent's parent
-    
-    def test_find_by_id_success(self, reset_mocks, monkeypatch):
-        """Test successful find_by_id"""
-        def mock_execute_query(query, params):
-            return [{
-                'id': 123,
-                'name': 'Test_Type',
-                'parent_id': None,
-                'path': 'Test_Type',
-                'level': 0,
-                'description': 'Test type description',
-                'created_at': '2023-01-01 00:00:00',
-                'updated_at': '2023-01-01 00:00:00'
-            }]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Type.find_by_id(123)
-        
-        assert result is not None
-        assert result.id == 123
-        assert result.name == 'Test_Type'
-    
-    def test_find_by_id_not_found(self, reset_mocks, monkeypatch):
+    @pytest.mark.parametrize("extra, update_error, expected, statement, params", [
+        ({}, None, True, "INSERT", _SAVE_PARAMS),
+        ({"id": 123}, None, True, "UPDATE", _SAVE_PARAMS + (123,)),
+        ({}, Exception("Database error"), False, "INSERT", _SAVE_PARAMS),
+    ], ids=["new", "existing", "database_error"])
+    def test_save(self, fake_db, stored_types, make_type, extra, update_error, expected,
+                  statement, params):
+        """Test save dispatches a single INSERT or UPDATE with the Type fields"""
+        type_obj = make_type(**extra)
+        stored_types[123] = make_type(id=123)
+        # Answers the LAST_INSERT_ID() query
+        fake_db.query_result = [{'id': 123}]
+        fake_db.raise_on_update = update_error
+        
+        assert type_obj.save() is expected
+        assert len(fake_db.updates) == 1
+        query, sent = fake_db.updates[0]
+        assert query.strip().startswith(statement)
+        assert sent == params
+        if expected:
+            assert type_obj.id == 123
+    
+    @pytest.mark.parametrize("type_id, with_child, expected", [
+        (123, False, True),
+        (None, False, False),
+        (123, True, True),
+    ], ids=["success", "no_id", "with_children"])
+    def test_delete(self, fake_db, monkeypatch, make_type, type_id, with_child, expected):
+        """Test delete removes stored types and moves children to the parent's parent"""
+        type_obj = make_type(id=type_id)
+        children = [make_type(name="Child_Type", parent_id=123, id=456)] if with_child else []
+        
+        save = Mock(return_value=True)
+        monkeypatch.setattr(Type, "find_children", Mock(return_value=children))
+        monkeypatch.setattr(Type, "save", save)
+        
+        assert type_obj.delete() is expected
+        assert [child.parent_id for child in children] == [None] * len(children)
+        assert save.call_count == len(children)
+    
+    @pytest.mark.parametrize("finder, args, rows, expected", [
+        (Type.find_by_id, (123,), [_ROW], [(123, 'Test_Type', None)]),
+        (Type.find_by_name, ("Test_Type",), [_ROW], [(123, 'Test_Type', None)]),
+        (Type.find_all, (), _ROWS, [(1, 'Type1', None), (2, 'Type2', 1)]),
+        (Type.find_roots, (), _ROWS[:1], [(1, 'Type1', None)]),
+        (Type(name="Type1", id=1).find_children, (), _ROWS[1:], [(2, 'Type2', 1)]),
+        (Type(name="Type1", path="Type1", id=1).find_descendants, (), _ROWS[1:],
+         [(2, 'Type2', 1)]),
+        (Type(name="Type2", path="Type1/Type2", id=2).find_ancestors, (), _ROWS[:1],
+         [(1, 'Type1', None)]),
+    ], ids=["find_by_id", "find_by_name", "find_all", "find_roots", "find_children",
+            "find_descendants", "find_ancestors"])
+    def test_finder_success(self, fake_db, finder, args, rows, expected):
+        """Test successful Type lookups"""
+        fake_db.query_result = rows
+        
+        result = finder(*args)
+        found = result if isinstance(result, list) else [result]
+        
+        assert [(t.id, t.name, t.parent_id) for t in found] == expected
+    
+    def test_find_by_id_not_found(self, fake_db):
         """Test find_by_id when not found"""
-        def mock_execute_query(query, params):
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
         result = Type.find_by_id(123)
         
         assert result is None
     
-    def test_find_by_name_success(self, reset_mocks, monkeypatch):
-        """Test successful find_by_name"""
-        def mock_execute_query(query, params):
-            return [{
-                'id': 123,
-                'name': 'Test_Type',
-                'parent_id': None,
-                'path': 'Test_Type',
-                'level': 0,
-                'description': 'Test type description',
-                'created_at': '2023-01-01 00:00:00',
-                'updated_at': '2023-01-01 00:00:00'
-            }]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Type.find_by_name("Test_Type")
-        
-        assert result is not None
-        assert result.id == 123
-        assert result.name == 'Test_Type'
-    
-    def test_find_all_success(self, reset_mocks, monkeypatch):
-        """Test successful find_all"""
-        def mock_execute_query(query):
-            return [
-                {
-                    'id': 1,
-                    'name': 'Type1',
-                    'parent_id': None,
-                    'path': 'Type1',
-                    'level': 0,
-                    'description': 'Type 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                },
-                {
-                    'id': 2,
-                    'name': 'Type2',
-                    'parent_id': 1,
-                    'path': 'Type1/Type2',
-                    'level': 1,
-                    'description': 'Type 2',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Type.find_all()
-        
-        assert len(result) == 2
-        assert result[0].name == 'Type1'
-        assert result[1].name == 'Type2'
-    
-    def test_find_roots_success(self, reset_mocks, monkeypatch):
-        """Test successful find_roots"""
-        def mock_execute_query(query):
-            return [
-                {
-                    'id': 1,
-                    'name': 'Root1',
-                    'parent_id': None,
-                    'path': 'Root1',
-                    'level': 0,
-                    'description': 'Root 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        result = Type.find_roots()
-        assert len(result) == 1
-        assert result[0].name == 'Root1'
-        assert result[0].parent_id is None
-    
-    def test_find_children_success(self, reset_mocks, monkeypatch):
-        """Test successful find_children"""
-        def mock_execute_query(query, params):
-            return [
-                {
-                    'id': 2,
-                    'name': 'Child1',
-                    'parent_id': 1,
-                    'path': 'Parent/Child1',
-                    'level': 1,
-                    'description': 'Child 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        type_obj = Type(name="Parent", id=1)
-        result = type_obj.find_children()
-        
-        assert len(result) == 1
-        assert result[0].name == 'Child1'
-        assert result[0].parent_id == 1
-    
-    def test_find_children_no_id(self):
-        """Test find_children with no ID"""
-        type_obj = Type(name="Parent")
-        result = type_obj.find_children()
-        
-        assert result == []
-    
-    def test_find_descendants_success(self, reset_mocks, monkeypatch):
-        """Test successful find_descendants"""
-        def mock_execute_query(query, params):
-            return [
-                {
-                    'id': 2,
-                    'name': 'Child1',
-                    'parent_id': 1,
-                    'path': 'Parent/Child1',
-                    'level': 1,
-                    'description': 'Child 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                },
-                {
-                    'id': 3,
-                    'name': 'Grandchild1',
-                    'parent_id': 2,
-                    'path': 'Parent/Child1/Grandchild1',
-                    'level': 2,
-                    'description': 'Grandchild 1',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }
-            ]
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        type_obj = Type(name="Parent", path="Parent", id=1)
-        result = type_obj.find_descendants()
-        
-        assert len(result) == 2
-        assert result[0].name == 'Child1'
-        assert result[1].name == 'Grandchild1'
-    
-    def test_find_descendants_no_id(self):
-        """Test find_descendants with no ID"""
-        type_obj = Type(name="Parent")
-        result = type_obj.find_descendants()
-        
-        assert result == []
-    
-    def test_find_ancestors_success(self, reset_mocks, monkeypatch):
-        """Test successful find_ancestors"""
-        def mock_execute_query(query, params):
-            if params and params[0] == "Parent":
-                return [{
-                    'id': 1,
-                    'name': 'Parent',
-                    'parent_id': None,
-                    'path': 'Parent',
-                    'level': 0,
-                    'description': 'Parent',
-                    'created_at': '2023-01-01 00:00:00',
-                    'updated_at': '2023-01-01 00:00:00'
-                }]
-            return []
-        
-        monkeypatch.setattr(db_manager, "execute_query", mock_execute_query, raising=True)
-        
-        type_obj = Type(name="Child", path="Parent/Child", id=2)
-        result = type_obj.find_ancestors()
-        
-        assert len(result) == 1
-        assert result[0].name == 'Parent'
-    
-    def test_find_ancestors_no_path(self):
-        """Test find_ancestors with no path"""
-        type_obj = Type(name="Root")
-        result = type_obj.find_ancestors()
-        
-        assert result == []
-    
-    def test_is_ancestor_of_true(self):
-        """Test is_ancestor_of returns True"""
-        parent = Type(name="Parent", path="Parent")
-        child = Type(name="Child", path="Parent/Child")
-        
-        result = parent.is_ancestor_of(child)
-        
-        assert result is True
-    
-    def test_is_ancestor_of_false(self):
-        """Test is_ancestor_of returns False"""
-        parent = Type(name="Parent", path="Parent")
-        child = Type(name="Child", path="Other/Child")
-        
-        result = parent.is_ancestor_of(child)
-        
-        assert result is False
-    
-    def test_is_descendant_of_true(self):
-        """Test is_descendant_of returns True"""
-        parent = Type(name="Parent", path="Parent")
-        child = Type(name="Child", path="Parent/Child")
-        
-        result = child.is_descendant_of(parent)
+    @pytest.mark.parametrize("method, expected", [
+        ("find_children", []),
+        ("find_descendants", []),
+        ("find_ancestors", []),
+        ("_parent_changed", False),
+    ])
+    def test_unsaved_type_short_circuits(self, method, expected):
+        """Test lookups on a Type without id or path return the empty default"""
+        type_obj = Type(name="Test_Type")
         
-        assert result is True
+        assert getattr(type_obj, method)() == expected
     
-    def test_is_descendant_of_false(self):
-        """Test is_descendant_of returns False"""
+    @pytest.mark.parametrize("method, child_path, expected", [
+        ("is_ancestor_of", "Parent/Child", True),
+        ("is_ancestor_of", "Other/Child", False),
+        ("is_descendant_of", "Parent/Child", True),
+        ("is_descendant_of", "Other/Child", False),
+    ], ids=["ancestor_true", "ancestor_false", "descendant_true", "descendant_false"])
+    def test_hierarchy_relation(self, method, child_path, expected):
+        """Test is_ancestor_of/is_descendant_of against a Parent type"""
         parent = Type(name="Parent", path="Parent")
-        child = Type(name="Child", path="Other/Child")
-        
-        result = child.is_descendant_of(parent)
+        child = Type(name="Child", path=child_path)
+        caller, other = (parent, child) if method == "is_ancestor_of" else (child, parent)
         
-        assert result is False
+        assert getattr(caller, method)(other) is expected
     
-    def test_str_representation(self):
+    def test_str_representation(self, make_type):
         """Test string representation"""
-        type_obj = Type(
-            name="Test_Type",
-            parent_id=1,
-            path="Parent/Test_Type",
-            level=1,
-            id=123
-        )
+        type_obj = make_type(parent_id=1, path="Parent/Test_Type", level=1, id=123)
         
         expected = "Type(id=123, name='Test_Type', path='Parent/Test_Type', level=1)"
         assert str(type_obj) == expected